@@ -9,6 +9,10 @@ OPENAPI_PYTHON_MAPPING = {
     "number": f"{int.__name__} or {float.__name__}",
 }
 
+# Schema keys
+REF_KEY = "$ref"
+RECURSIVE_REF_REPLACED_KEY = "x-recursive-ref-replaced"
+
 # Validation errors
 VALIDATE_FORMAT_ERROR = 'Expected: {article} "{format}" formatted value\n\nReceived: {received}'
 VALIDATE_PATTERN_ERROR = 'The string "{data}" does not match the specified pattern: {pattern}'
@@ -42,4 +46,5 @@ VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR = (
 VALIDATE_ONE_OF_ERROR = "Expected data to match one and only one of the oneOf schema types; found {matches} matches"
 VALIDATE_ANY_OF_ERROR = "Expected data to match one or more of the documented anyOf schema types, but found no matches"
 UNDOCUMENTED_SCHEMA_SECTION_ERROR = "Error: Unsuccessfully tried to index the OpenAPI schema by `{key}`. {error_addon}"
+UNRESOLVABLE_REFERENCE_ERROR = "Error: Unable to resolve the schema reference `{ref}`."
 INIT_ERROR = "Unable to configure loader"
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
+import mmap
+import os
 import pathlib
 import re
-from json import dumps, loads
+from copy import deepcopy
 from typing import TYPE_CHECKING, cast
 from urllib.parse import urlparse
 
@@ -18,34 +21,144 @@ from prance.util.resolver import RefResolver
 from rest_framework.schemas.generators import BaseSchemaGenerator, EndpointEnumerator
 from rest_framework.settings import api_settings
 
-from openapi_tester.constants import UNDOCUMENTED_SCHEMA_SECTION_ERROR
+from openapi_tester.constants import RECURSIVE_REF_REPLACED_KEY, REF_KEY, UNDOCUMENTED_SCHEMA_SECTION_ERROR
 from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.references import de_reference, scan_refs
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover
+    process = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from typing import Any, Callable
     from urllib.parse import ParseResult
 
     from django.urls import ResolverMatch
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_yasg.generators import OpenAPISchemaGenerator
     from rest_framework.views import APIView
 
 
 def handle_recursion_limit(schema: dict) -> Callable:
     """
     We are using a currying pattern to pass schema into the scope of the handler.
+
+    Schema definitions are indexed by their fragment up front, since the handler may be called many times.
     """
+    definitions = {
+        **{f"/definitions/{key}": value for key, value in schema.get("definitions", {}).items()},
+        **{
+            f"/components/schemas/{key}": value
+            for key, value in schema.get("components", {}).get("schemas", {}).items()
+        },
+    }
 
     # noinspection PyUnusedLocal
     def handler(iteration: int, parse_result: ParseResult, recursions: tuple):  # pylint: disable=unused-argument
         fragment = parse_result.fragment
-        keys = [key for key in fragment.split("/") if key]
-        definition = schema
-        for key in keys:
-            definition = definition[key]
-        return definition
+        if fragment in definitions:
+            definition = definitions[fragment]
+        else:
+            keys = [key for key in fragment.split("/") if key]
+            definition = schema
+            for key in keys:
+                definition = definition[key]
+        return remove_recursive_ref(deepcopy(definition), fragment)
 
     return handler
 
 
+def remove_recursive_ref(schema: dict, fragment: str) -> dict:
+    """
+    Replaces, in place, every ``$ref`` pointing at the given fragment with a marker object, so recursion terminates.
+    """
+    stack: list[dict | list] = [schema]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(value, dict) and str(value.get(REF_KEY, "")).endswith(f"#{fragment}"):
+                node[key] = {RECURSIVE_REF_REPLACED_KEY: True}
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return schema
+
+
+route_parameter_pattern = re.compile(r"<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>")
+path_parameter_pattern = re.compile(r"{(?P<parameter>\w+)}")
+# drops the scheme, netloc and last segment params (as ``urlparse`` does), the leading slash, the query and the fragment
+endpoint_path_pattern = re.compile(
+    r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?(?://[^/?#]*)?/?(?P<path>[^?#]*?)(?:;[^/?#]*)?(?:[?#].*)?\Z", re.DOTALL
+)
+openapi_version_pattern = re.compile(r"^(\d)\.(\d+)")
+openapi_3_spec_validators = {
+    ("3", "0"): openapi_v30_spec_validator,
+    ("3", "1"): openapi_v31_spec_validator,
+}
+validated_schema_fingerprints: set[str] = set()
+static_schema_cache: dict[tuple[str, int, int], dict] = {}
+
+
+def schema_fingerprint(schema: dict) -> str | None:
+    """
+    Returns a digest of the schema contents, or None when the schema is not JSON serializable.
+    """
+    try:
+        if orjson is not None:
+            serialized_schema = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            try:
+                serialized_schema = json.dumps(schema, sort_keys=True).encode()
+            except TypeError:
+                # objects mixing int and str keys (e.g. unquoted YAML status codes) cannot be sorted
+                serialized_schema = json.dumps(schema).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized_schema).hexdigest()
+
+
+def parse_json(content: str | bytes | memoryview) -> Any:
+    """
+    Parses JSON content, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
+
+def get_close_matches(word: str, possibilities: list[str], n: int = 3, cutoff: float = 0.6) -> list[str]:
+    """
+    Returns the best matches for a word, using rapidfuzz when it is installed and difflib otherwise.
+    """
+    if process is not None:
+        matches = process.extract(word, possibilities, scorer=fuzz.ratio, limit=n, score_cutoff=cutoff * 100)
+        return [match[0] for match in matches]
+    return difflib.get_close_matches(word, possibilities, n=n, cutoff=cutoff)
+
+
+def to_plain_schema(value: Any) -> Any:
+    """
+    Recursively converts dict subclasses (e.g. ``OrderedDict``) and tuples into plain dicts and lists.
+    """
+    if isinstance(value, dict):
+        return {key: to_plain_schema(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain_schema(item) for item in value]
+    return value
+
+
 class BaseSchemaLoader:
     """
     Base class for OpenAPI schema loading classes.
@@ -62,6 +175,7 @@ class BaseSchemaLoader:
         super().__init__()
         self.schema: dict | None = None
         self.field_key_map = field_key_map or {}
+        self.resolved_paths: dict[tuple[str, str], tuple[str, ResolverMatch]] = {}
 
     def load_schema(self) -> dict:
         """
@@ -73,12 +187,16 @@ class BaseSchemaLoader:
         """
         Returns OpenAPI schema.
         """
-        if self.schema:
-            return self.schema
-        self.set_schema(self.load_schema())
-        return self.get_schema()
+        if self.schema is None:
+            self.set_schema(self.load_schema())
+        return cast("dict", self.schema)
 
     def de_reference_schema(self, schema: dict) -> dict:
+        contains_ref, contains_external_ref = scan_refs(schema)
+        if not contains_ref:
+            return schema
+        if not contains_external_ref:
+            return de_reference(schema, recursion_limit=10)
         url = schema.get("basePath", self.base_path)
         recursion_handler = handle_recursion_limit(schema)
         resolver = RefResolver(
@@ -102,16 +220,17 @@ class BaseSchemaLoader:
 
     @staticmethod
     def validate_schema(schema: dict):
+        """
+        Validates the schema against the OpenAPI specification, skipping schemas already validated in this process.
+        """
+        fingerprint = schema_fingerprint(schema)
+        if fingerprint in validated_schema_fingerprints:
+            return
         if "openapi" in schema:
-            openapi_version_pattern = re.compile(r"^(\d)\.(\d+)")
             result = openapi_version_pattern.findall(schema["openapi"])
             if result:
-                major, minor = result[0]
-                if (major, minor) == ("3", "0"):
-                    validator = openapi_v30_spec_validator
-                elif (major, minor) == ("3", "1"):
-                    validator = openapi_v31_spec_validator
-                else:
+                validator = openapi_3_spec_validators.get(result[0])
+                if validator is None:
                     raise UndocumentedSchemaSectionError(
                         UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(
                             key=schema["openapi"], error_addon="Support might need to be added."
@@ -122,6 +241,8 @@ class BaseSchemaLoader:
         else:
             validator = openapi_v2_spec_validator
         validator.validate(schema)
+        if fingerprint:
+            validated_schema_fingerprints.add(fingerprint)
 
     def set_schema(self, schema: dict) -> None:
         """
@@ -138,14 +259,30 @@ class BaseSchemaLoader:
         """
         return list({endpoint[0] for endpoint in EndpointEnumerator().get_api_endpoints()})
 
+    def clear_cache(self) -> None:
+        """
+        Drops the de-referenced schema and the resolved paths, e.g. after the URLconf changed.
+        """
+        self.schema = None
+        self.resolved_paths = {}
+        self.__dict__.pop("endpoints", None)
+
     def resolve_path(self, endpoint_path: str, method: str) -> tuple[str, ResolverMatch]:
         """
         Resolves a Django path.
+
+        Results are memoized per loader, so each distinct path is only matched against the URLconf once.
+        """
+        cache_key = (endpoint_path, method)
+        if cache_key not in self.resolved_paths:
+            self.resolved_paths[cache_key] = self.resolve_django_path(endpoint_path=endpoint_path, method=method)
+        return self.resolved_paths[cache_key]
+
+    def resolve_django_path(self, endpoint_path: str, method: str) -> tuple[str, ResolverMatch]:
         """
-        url_object = urlparse(endpoint_path)
-        parsed_path = url_object.path
-        if not parsed_path.startswith("/"):
-            parsed_path = "/" + parsed_path
+        Matches a path against the URLconf and re-parameterizes it.
+        """
+        parsed_path = endpoint_path_pattern.sub(r"/\g<path>", endpoint_path, count=1)
         for key, value in self.field_key_map.items():
             if value != "pk" and key in parsed_path:
                 parsed_path = parsed_path.replace(f"{{{key}}}", value)
@@ -155,20 +292,40 @@ class BaseSchemaLoader:
             except Resolver404:
                 continue
             else:
-                for key, value in reversed(list(resolved_route.kwargs.items())):
-                    index = path.rfind(str(value))
-                    path = f"{path[:index]}{{{key}}}{path[index + len(str(value)):]}"
+                path = self.parameterize_path(path=path, resolved_route=resolved_route)
                 if "{pk}" in path and api_settings.SCHEMA_COERCE_PATH_PK:  # noqa: FS003
                     path, resolved_route = self.handle_pk_parameter(
                         resolved_route=resolved_route, path=path, method=method
                     )
                 return path, resolved_route
         message = f"Could not resolve path `{endpoint_path}`."
-        close_matches = difflib.get_close_matches(endpoint_path, self.endpoints)
+        close_matches = get_close_matches(endpoint_path, self.endpoints)
         if close_matches:
             message += "\n\nDid you mean one of these?\n\n- " + "\n- ".join(close_matches)
         raise ValueError(message)
 
+    @staticmethod
+    def parameterize_path(path: str, resolved_route: ResolverMatch) -> str:
+        """
+        Replaces the resolved kwargs values in a path with their parameter names.
+
+        The parameterized path is built from the matched route (e.g. ``api/<str:version>/items``) when possible, and
+        only falls back to substituting the kwargs values back into the path for regex (``re_path``) routes.
+        """
+        route = getattr(resolved_route, "route", None)
+        if route:
+            parameterized_path = "/" + route_parameter_pattern.sub(r"{\g<parameter>}", route)
+            kwargs = {key: str(value) for key, value in resolved_route.kwargs.items()}
+            filled_path = path_parameter_pattern.sub(
+                lambda match: kwargs.get(match.group("parameter"), match.group(0)), parameterized_path
+            )
+            if filled_path == path:
+                return parameterized_path
+        for key, value in reversed(list(resolved_route.kwargs.items())):
+            index = path.rfind(str(value))
+            path = f"{path[:index]}{{{key}}}{path[index + len(str(value)):]}"
+        return path
+
     @staticmethod
     def handle_pk_parameter(resolved_route: ResolverMatch, path: str, method: str) -> tuple[str, ResolverMatch]:
         """
@@ -192,23 +349,54 @@ class DrfYasgSchemaLoader(BaseSchemaLoader):
 
     def __init__(self, field_key_map: dict[str, str] | None = None) -> None:
         super().__init__(field_key_map=field_key_map)
+        self._cached_schema: dict | None = None
+
+    @cached_property
+    def schema_generator(self) -> OpenAPISchemaGenerator:
+        """
+        Returns the drf-yasg schema generator, created on first use.
+        """
         from drf_yasg.generators import OpenAPISchemaGenerator
         from drf_yasg.openapi import Info
 
-        self.schema_generator = OpenAPISchemaGenerator(info=Info(title="", default_version=""))
+        return OpenAPISchemaGenerator(info=Info(title="", default_version=""))
 
     def load_schema(self) -> dict:
         """
         Loads generated schema from drf-yasg and returns it as a dict.
+
+        The schema is generated once per loader; call ``clear_cache`` to regenerate it.
+        """
+        if self._cached_schema is None:
+            odict_schema = self.schema_generator.get_schema(None, True)
+            self._cached_schema = cast("dict", to_plain_schema(odict_schema.as_odict()))
+        return self._cached_schema
+
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        self._cached_schema = None
+        self.__dict__.pop("path_prefix", None)
+        self.__dict__.pop("path_prefix_length", None)
+
+    @cached_property
+    def path_prefix(self) -> str:
+        """
+        Returns the common path prefix drf-yasg strips from the documented endpoints.
         """
-        odict_schema = self.schema_generator.get_schema(None, True)
-        return cast("dict", loads(dumps(odict_schema.as_odict())))
+        return self.schema_generator.determine_path_prefix(self.endpoints)
+
+    @cached_property
+    def path_prefix_length(self) -> int:
+        """
+        Returns the number of leading characters to trim from resolved paths.
+        """
+        return len(self.path_prefix) if self.path_prefix != "/" else 0
 
     def resolve_path(self, endpoint_path: str, method: str) -> tuple[str, ResolverMatch]:
         de_parameterized_path, resolved_path = super().resolve_path(endpoint_path=endpoint_path, method=method)
-        path_prefix = self.schema_generator.determine_path_prefix(self.endpoints)
-        trim_length = len(path_prefix) if path_prefix != "/" else 0
-        return de_parameterized_path[trim_length:], resolved_path
+        if self.path_prefix_length:
+            de_parameterized_path = de_parameterized_path[self.path_prefix_length :]
+        return de_parameterized_path, resolved_path
 
 
 class DrfSpectacularSchemaLoader(BaseSchemaLoader):
@@ -218,24 +406,38 @@ class DrfSpectacularSchemaLoader(BaseSchemaLoader):
 
     def __init__(self, field_key_map: dict[str, str] | None = None) -> None:
         super().__init__(field_key_map=field_key_map)
+        self._cached_schema: dict | None = None
+
+    @cached_property
+    def schema_generator(self) -> SchemaGenerator:
+        """
+        Returns the drf_spectacular schema generator, created on first use.
+        """
         from drf_spectacular.generators import SchemaGenerator
 
-        self.schema_generator = SchemaGenerator()
+        return SchemaGenerator()
 
     def load_schema(self) -> dict:
         """
         Loads generated schema from drf_spectacular and returns it as a dict.
+
+        The schema is generated once per loader; call ``clear_cache`` to regenerate it.
         """
-        return cast("dict", loads(dumps(self.schema_generator.get_schema(public=True))))
+        if self._cached_schema is None:
+            self._cached_schema = cast("dict", to_plain_schema(self.schema_generator.get_schema(public=True)))
+        return self._cached_schema
+
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        self._cached_schema = None
 
     def resolve_path(self, endpoint_path: str, method: str) -> tuple[str, ResolverMatch]:
         from drf_spectacular.settings import spectacular_settings
 
         de_parameterized_path, resolved_path = super().resolve_path(endpoint_path=endpoint_path, method=method)
-        return (
-            de_parameterized_path[len(spectacular_settings.SCHEMA_PATH_PREFIX or "") :],
-            resolved_path,
-        )
+        if spectacular_settings.SCHEMA_PATH_PREFIX:
+            de_parameterized_path = de_parameterized_path[len(spectacular_settings.SCHEMA_PATH_PREFIX) :]
+        return de_parameterized_path, resolved_path
 
 
 class StaticSchemaLoader(BaseSchemaLoader):
@@ -251,14 +453,31 @@ class StaticSchemaLoader(BaseSchemaLoader):
         """
         Loads a static OpenAPI schema from file, and parses it to a python dict.
 
+        Parsed schemas are shared between loaders until the file changes, so the returned dict must not be mutated.
+
         :return: Schema contents as a dict
         :raises: ImproperlyConfigured
         """
-        with open(self.path, encoding="utf-8") as file:
-            content = file.read()
-            return cast(
-                "dict", json.loads(content) if ".json" in self.path else yaml.load(content, Loader=yaml.FullLoader)
-            )
+        stat = os.stat(self.path)
+        cache_key = (os.path.abspath(self.path), stat.st_mtime_ns, stat.st_size)
+        if cache_key not in static_schema_cache:
+            with open(self.path, "rb") as file:
+                if stat.st_size:
+                    # parse straight from the mapped file pages instead of copying the file into memory first
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        static_schema_cache[cache_key] = self.parse_content(content)
+                else:
+                    static_schema_cache[cache_key] = self.parse_content(file.read())
+        return static_schema_cache[cache_key]
+
+    def parse_content(self, content: bytes | mmap.mmap) -> dict[str, Any]:
+        """
+        Parses raw file contents as JSON or YAML, based on the file extension.
+        """
+        if pathlib.Path(self.path).suffix.lower() == ".json":
+            with memoryview(content) as view:
+                return cast("dict", parse_json(view))
+        return cast("dict", yaml.load(content, Loader=YamlLoader))
 
 
 class UrlStaticSchemaLoader(BaseSchemaLoader):
@@ -280,7 +499,7 @@ class UrlStaticSchemaLoader(BaseSchemaLoader):
         response = requests.get(self.url, timeout=20)
         return cast(
             "dict",
-            json.loads(response.content)
-            if ".json" in self.url
-            else yaml.load(response.content, Loader=yaml.FullLoader),
+            parse_json(response.content)
+            if pathlib.PurePosixPath(urlparse(self.url).path).suffix.lower() == ".json"
+            else yaml.load(response.content, Loader=YamlLoader),
         )
@@ -0,0 +1,215 @@
+""" References Module - resolves local ``$ref`` pointers in OpenAPI schemas """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+from urllib.parse import unquote
+
+from openapi_tester.constants import RECURSIVE_REF_REPLACED_KEY, REF_KEY, UNRESOLVABLE_REFERENCE_ERROR
+from openapi_tester.exceptions import OpenAPISchemaError
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+
+def scan_refs(schema: dict) -> tuple[bool, bool]:
+    """
+    Returns whether the schema contains a ``$ref``, and whether any ``$ref`` points outside of the schema document.
+
+    The schema is walked once, and the walk stops at the first external reference.
+    """
+    found_ref = False
+    stack: list[dict | list] = [schema]
+    values: Iterable[Any]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get(REF_KEY)
+            if isinstance(ref, str):
+                if not ref.startswith("#"):
+                    return True, True
+                found_ref = True
+            values = node.values()
+        else:
+            values = node
+        for value in values:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+    return found_ref, False
+
+
+class ReferenceResolver:
+    """
+    Replaces local ``$ref`` objects with the objects they point at.
+
+    References that form a cycle (a schema referring to itself, or schemas referring to each other) are grouped
+    together. Following a reference to a schema in the same cycle uses up one level of the recursion limit, and once the
+    limit is exceeded the reference is replaced with ``{"x-recursive-ref-replaced": True}``. Entering a cycle from
+    outside starts with the full limit, so a resolved value only depends on the target and the remaining limit, and is
+    computed once and shared between all the places that refer to it.
+    """
+
+    def __init__(self, schema: dict, recursion_limit: int = 10) -> None:
+        self.schema = schema
+        self.recursion_limit = recursion_limit
+        self.resolved_targets: dict[tuple[str, int], Any] = {}
+        self.edges: dict[str, list[str]] = {}
+        self.cycles: dict[str, int] = {}
+
+    def resolve_references(self) -> dict:
+        self.cycles = self.get_cycles()
+        # resolve targets depth-first with an explicit stack, so long reference chains cannot exhaust the call stack
+        stack = self.get_target_keys(collect_refs(self.schema), cycle=None, remaining=self.recursion_limit)
+        while stack:
+            target_key = stack[-1]
+            if target_key in self.resolved_targets:
+                stack.pop()
+                continue
+            ref, remaining = target_key
+            cycle = self.cycles[ref]
+            unresolved_keys = [
+                key
+                for key in self.get_target_keys(self.edges[ref], cycle=cycle, remaining=remaining)
+                if key not in self.resolved_targets
+            ]
+            if unresolved_keys:
+                stack.extend(unresolved_keys)
+                continue
+            stack.pop()
+            self.resolved_targets[target_key] = self.substitute_refs(self.get_target(ref), cycle, remaining)
+        return cast("dict", self.substitute_refs(self.schema, cycle=None, remaining=self.recursion_limit))
+
+    def get_target(self, ref: str) -> Any:
+        """
+        Returns the object a local JSON pointer (e.g. ``#/components/schemas/Pet``) points at.
+        """
+        if ref != "#" and not ref.startswith("#/"):
+            raise OpenAPISchemaError(UNRESOLVABLE_REFERENCE_ERROR.format(ref=ref))
+        target: Any = self.schema
+        for token in ref[1:].split("/")[1:]:
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                raise OpenAPISchemaError(UNRESOLVABLE_REFERENCE_ERROR.format(ref=ref)) from e
+        return target
+
+    def get_cycles(self) -> dict[str, int]:
+        """
+        Maps every reachable reference to the strongly connected component of the reference graph it belongs to.
+        """
+        edges = self.edges
+        pending = collect_refs(self.schema)
+        while pending:
+            ref = pending.pop()
+            if ref not in edges:
+                edges[ref] = collect_refs(self.get_target(ref))
+                pending.extend(edges[ref])
+
+        # iterative Tarjan's algorithm, so long reference chains cannot exhaust the call stack
+        cycles: dict[str, int] = {}
+        indices: dict[str, int] = {}
+        low_links: dict[str, int] = {}
+        component_stack: list[str] = []
+        on_stack: set[str] = set()
+        for root in edges:
+            if root in indices:
+                continue
+            work: list[tuple[str, int]] = [(root, 0)]
+            while work:
+                ref, edge_index = work.pop()
+                if edge_index == 0:
+                    indices[ref] = low_links[ref] = len(indices)
+                    component_stack.append(ref)
+                    on_stack.add(ref)
+                if edge_index < len(edges[ref]):
+                    work.append((ref, edge_index + 1))
+                    dependency = edges[ref][edge_index]
+                    if dependency not in indices:
+                        work.append((dependency, 0))
+                    elif dependency in on_stack:
+                        low_links[ref] = min(low_links[ref], indices[dependency])
+                    continue
+                if low_links[ref] == indices[ref]:
+                    while True:
+                        member = component_stack.pop()
+                        on_stack.discard(member)
+                        cycles[member] = indices[ref]
+                        if member == ref:
+                            break
+                if work:
+                    parent = work[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[ref])
+        return cycles
+
+    def get_target_key(self, ref: str, cycle: int | None, remaining: int) -> tuple[str, int] | None:
+        """
+        Returns the key a reference found in the given cycle resolves to, or None once the recursion limit is exceeded.
+        """
+        if self.cycles[ref] == cycle:
+            if remaining == 0:
+                return None
+            return ref, remaining - 1
+        return ref, self.recursion_limit
+
+    def get_target_keys(self, refs: list[str], cycle: int | None, remaining: int) -> list[tuple[str, int]]:
+        target_keys = (self.get_target_key(ref, cycle, remaining) for ref in refs)
+        return [target_key for target_key in target_keys if target_key is not None]
+
+    def substitute_refs(self, node: Any, cycle: int | None, remaining: int) -> Any:
+        """
+        Returns a copy of the node with its references replaced by their, already resolved, targets.
+        """
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any]] = [(node, root, 0)]
+        while stack:
+            current, parent, key = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get(REF_KEY)
+                if isinstance(ref, str):
+                    target_key = self.get_target_key(ref, cycle, remaining)
+                    parent[key] = (
+                        self.resolved_targets[target_key] if target_key is not None else {RECURSIVE_REF_REPLACED_KEY: True}
+                    )
+                    continue
+                copied_dict: dict = dict.fromkeys(current)
+                parent[key] = copied_dict
+                stack.extend((value, copied_dict, item_key) for item_key, value in current.items())
+            elif isinstance(current, list):
+                copied_list: list = [None] * len(current)
+                parent[key] = copied_list
+                stack.extend((value, copied_list, index) for index, value in enumerate(current))
+            else:
+                parent[key] = current
+        return root[0]
+
+
+def collect_refs(node: Any) -> list[str]:
+    """
+    Returns the ``$ref`` values found in a schema section, without following them.
+    """
+    refs = []
+    stack = [node]
+    values: Iterable[Any]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get(REF_KEY)
+            if isinstance(ref, str):
+                refs.append(ref)
+                continue
+            values = node.values()
+        elif isinstance(node, list):
+            values = node
+        else:
+            continue
+        for value in values:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+    return refs
+
+
+def de_reference(schema: dict, recursion_limit: int = 10) -> dict:
+    """
+    Returns a copy of the schema with all local references resolved.
+    """
+    return ReferenceResolver(schema, recursion_limit=recursion_limit).resolve_references()
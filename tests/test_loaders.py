@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import json
+from collections import OrderedDict
+from copy import deepcopy
 from unittest.mock import Mock, patch
+from urllib.parse import urlparse
 
 import pytest
+from django.urls import resolve
 
 from openapi_tester.loaders import (
+    BaseSchemaLoader,
     DrfSpectacularSchemaLoader,
     DrfYasgSchemaLoader,
     StaticSchemaLoader,
     UrlStaticSchemaLoader,
+    get_close_matches,
+    handle_recursion_limit,
+    orjson,
+    parse_json,
+    remove_recursive_ref,
+    schema_fingerprint,
+    to_plain_schema,
 )
 from tests.utils import TEST_ROOT, get_schema_content
 
@@ -53,6 +66,10 @@ def test_loader_get_route(loader):
     assert loader.resolve_path("api/v1/items", "get")[0] == "/api/{version}/items"
     assert loader.resolve_path("/api/v1/snake-case/", "get")[0] == "/api/{version}/snake-case/"
     assert loader.resolve_path("api/v1/snake-case/", "get")[0] == "/api/{version}/snake-case/"
+    assert loader.resolve_path("/api/v1/items/?page=1#top", "get")[0] == "/api/{version}/items"
+    assert loader.resolve_path("http://testserver/api/v1/items", "get")[0] == "/api/{version}/items"
+    assert loader.resolve_path("//testserver/api/v1/items", "get")[0] == "/api/{version}/items"
+    assert loader.resolve_path("/api/v1/items;page=1", "get")[0] == "/api/{version}/items"
     with pytest.raises(ValueError, match="Could not resolve path `test`"):
         assert loader.resolve_path("test", "get")
 
@@ -73,3 +90,192 @@ def test_static_loader_resolve_nested_route(loader):
         loader.resolve_path("/api/v1/categories/1/subcategories/1/", "get")[0]
         == "/api/{version}/categories/{category_pk}/subcategories/{subcategory_pk}/"
     )
+
+
+def test_loader_get_schema_is_cached():
+    loader = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "en"})
+    with patch.object(loader, "de_reference_schema", wraps=loader.de_reference_schema) as de_reference_schema:
+        schema = loader.get_schema()
+        assert loader.get_schema() is schema
+    de_reference_schema.assert_called_once()
+
+
+@pytest.mark.parametrize("loader_class", [DrfYasgSchemaLoader, DrfSpectacularSchemaLoader])
+def test_generated_schema_loader_caches_schema(loader_class):
+    loader = loader_class()
+    with patch.object(loader.schema_generator, "get_schema", wraps=loader.schema_generator.get_schema) as get_schema:
+        schema = loader.load_schema()
+        assert loader.load_schema() is schema
+        get_schema.assert_called_once()
+        loader.clear_cache()
+        assert loader.load_schema() is not schema
+        assert get_schema.call_count == 2
+
+
+def test_to_plain_schema():
+    converted = to_plain_schema(OrderedDict(a=OrderedDict(b=(1, OrderedDict(c="d")))))
+    assert converted == {"a": {"b": [1, {"c": "d"}]}}
+    assert type(converted) is dict
+    assert type(converted["a"]) is dict
+    assert type(converted["a"]["b"][1]) is dict
+
+
+def test_remove_recursive_ref():
+    schema = {
+        "type": "object",
+        "properties": {
+            "parent": {"$ref": "#/components/schemas/Node"},
+            "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+            "siblings": {"allOf": [{"$ref": "#/components/schemas/Node"}]},
+            "other": {"$ref": "#/components/schemas/NodeList"},
+        },
+    }
+    assert remove_recursive_ref(schema, "/components/schemas/Node") == {
+        "type": "object",
+        "properties": {
+            "parent": {"x-recursive-ref-replaced": True},
+            "children": {"type": "array", "items": {"x-recursive-ref-replaced": True}},
+            "siblings": {"allOf": [{"x-recursive-ref-replaced": True}]},
+            "other": {"$ref": "#/components/schemas/NodeList"},
+        },
+    }
+
+
+def test_de_reference_recursive_schema():
+    node = {"type": "object", "properties": {"child": {"$ref": "#/components/schemas/Node"}}}
+    schema = {
+        "openapi": "3.0.0",
+        "info": {"title": "", "version": ""},
+        "paths": {},
+        "components": {"schemas": {"Node": node}},
+    }
+    de_referenced_schema = StaticSchemaLoader(yaml_schema_path).de_reference_schema(schema)
+    assert "$ref" not in json.dumps(de_referenced_schema)
+    assert "x-recursive-ref-replaced" in json.dumps(de_referenced_schema)
+    assert node["properties"]["child"] == {"$ref": "#/components/schemas/Node"}
+
+
+@pytest.mark.parametrize("loader", loaders)
+def test_loader_resolve_path_is_cached(loader):
+    loader.clear_cache()
+    with patch("openapi_tester.loaders.resolve", wraps=resolve) as mocked_resolve:
+        first = loader.resolve_path("/api/v1/cars/correct", "get")
+        assert loader.resolve_path("/api/v1/cars/correct", "get") == first
+    mocked_resolve.assert_called_once()
+
+
+def test_loader_clear_cache_drops_endpoints():
+    loader = DrfYasgSchemaLoader()
+    endpoints = loader.endpoints
+    path_prefix = loader.path_prefix
+    path_prefix_length = loader.path_prefix_length
+    assert loader.endpoints is endpoints
+    loader.clear_cache()
+    assert loader.endpoints is not endpoints
+    assert loader.path_prefix == path_prefix
+    assert loader.path_prefix_length == path_prefix_length
+
+
+def test_validate_schema_is_cached():
+    loader = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "en"})
+    schema = deepcopy(loader.de_reference_schema(loader.load_schema()))
+    loader.validate_schema(schema)
+    mocked_validator = Mock()
+    with patch.dict("openapi_tester.loaders.openapi_3_spec_validators", {("3", "0"): mocked_validator}):
+        loader.validate_schema(deepcopy(schema))
+        mocked_validator.validate.assert_not_called()
+        schema["info"]["title"] = "Changed title"
+        loader.validate_schema(schema)
+        mocked_validator.validate.assert_called_once_with(schema)
+
+
+def test_static_loader_detects_file_type_by_extension(tmp_path):
+    schema_path = tmp_path / "specs.json.d" / "schema.yaml"
+    schema_path.parent.mkdir()
+    schema_path.write_text(get_schema_content(yaml_schema_path).decode("utf-8"), encoding="utf-8")
+    assert StaticSchemaLoader(str(schema_path)).load_schema() == StaticSchemaLoader(yaml_schema_path).load_schema()
+
+
+def test_static_loader_caches_parsed_schema(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"openapi": "3.0.0"}', encoding="utf-8")
+    schema = StaticSchemaLoader(str(schema_path)).load_schema()
+    assert StaticSchemaLoader(str(schema_path)).load_schema() is schema
+
+    schema_path.write_text('{"openapi": "3.0.1", "info": {}}', encoding="utf-8")
+    assert StaticSchemaLoader(str(schema_path)).load_schema() == {"openapi": "3.0.1", "info": {}}
+
+
+@pytest.mark.parametrize("content", ['{"openapi": "3.0.0"}', b'{"openapi": "3.0.0"}'])
+def test_parse_json_without_orjson(content):
+    with patch("openapi_tester.loaders.orjson", None):
+        assert parse_json(content) == {"openapi": "3.0.0"}
+    assert parse_json(content) == {"openapi": "3.0.0"}
+
+
+def test_parameterize_path():
+    assert BaseSchemaLoader.parameterize_path("/api/s/cars/correct", resolve("/api/s/cars/correct")) == (
+        "/api/{version}/cars/correct"
+    )
+    # regex routes fall back to substituting the resolved values
+    assert BaseSchemaLoader.parameterize_path("/api/pet/12", resolve("/api/pet/12")) == "/api/pet/{petId}"
+    router_path = "/api/v1/router_generated/names/1/"
+    assert (
+        BaseSchemaLoader.parameterize_path(router_path, resolve(router_path))
+        == "/api/{version}/router_generated/names/{pk}/"
+    )
+
+
+def test_de_reference_schema_without_refs():
+    schema = {"swagger": "2.0", "info": {"title": "", "version": ""}, "paths": {}}
+    with patch("openapi_tester.loaders.RefResolver") as mocked_resolver:
+        assert StaticSchemaLoader(yaml_schema_path).de_reference_schema(schema) is schema
+    mocked_resolver.assert_not_called()
+
+
+def test_get_close_matches():
+    possibilities = ["/api/{version}/cars/correct", "/api/{version}/trucks/correct", "/api/{version}/animals"]
+    expected = ["/api/{version}/cars/correct", "/api/{version}/trucks/correct"]
+    assert get_close_matches("/api/v1/blars/correct", possibilities) == expected
+    with patch("openapi_tester.loaders.process", None):
+        assert get_close_matches("/api/v1/blars/correct", possibilities) == expected
+
+
+def test_handle_recursion_limit():
+    node = {"type": "object", "properties": {"child": {"$ref": "#/components/schemas/Node"}}}
+    schema = {"components": {"schemas": {"Node": node}}, "paths": {"/": {"get": {}}}}
+    handler = handle_recursion_limit(schema)
+    assert handler(10, urlparse("#/components/schemas/Node"), ()) == {
+        "type": "object",
+        "properties": {"child": {"x-recursive-ref-replaced": True}},
+    }
+    assert node["properties"]["child"] == {"$ref": "#/components/schemas/Node"}
+
+
+@pytest.mark.parametrize("loader_class", [DrfYasgSchemaLoader, DrfSpectacularSchemaLoader])
+def test_generated_schema_loader_creates_generator_lazily(loader_class):
+    loader = loader_class()
+    assert "schema_generator" not in loader.__dict__
+    assert loader.schema_generator is loader.schema_generator
+
+
+@pytest.mark.parametrize("orjson_module", [orjson, None])
+def test_static_loader_parses_mapped_json_file(tmp_path, orjson_module):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_bytes(get_schema_content(json_schema_path))
+    with patch("openapi_tester.loaders.orjson", orjson_module):
+        assert StaticSchemaLoader(str(schema_path)).load_schema() == json.loads(schema_path.read_bytes())
+
+
+def test_static_loader_empty_file(tmp_path):
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.touch()
+    assert StaticSchemaLoader(str(schema_path)).load_schema() is None
+
+
+@pytest.mark.parametrize("orjson_module", [orjson, None])
+def test_schema_fingerprint_with_int_keys(orjson_module):
+    schema = {"paths": {"/": {"get": {"responses": {200: {"description": ""}, "default": {"description": ""}}}}}}
+    with patch("openapi_tester.loaders.orjson", orjson_module):
+        assert schema_fingerprint(schema) is not None
+        assert schema_fingerprint(schema) == schema_fingerprint(deepcopy(schema))
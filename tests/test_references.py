@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_tester.exceptions import OpenAPISchemaError
+from openapi_tester.references import de_reference, scan_refs
+
+pet = {"type": "object", "properties": {"name": {"type": "string"}}}
+node = {"type": "object", "properties": {"child": {"$ref": "#/components/schemas/Node"}}}
+
+
+def test_de_reference():
+    schema = {
+        "paths": {"/pets": {"get": {"responses": {"200": {"schema": {"$ref": "#/components/schemas/Pets"}}}}}},
+        "components": {
+            "schemas": {
+                "Pet": pet,
+                "Pets": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+                "Odd~Name/Pet": {"$ref": "#/components/schemas/Pet"},
+                "Odd": {"$ref": "#/components/schemas/Odd~0Name~1Pet"},
+            }
+        },
+    }
+    de_referenced_schema = de_reference(schema)
+    response_schema = de_referenced_schema["paths"]["/pets"]["get"]["responses"]["200"]["schema"]
+    assert response_schema == {"type": "array", "items": pet}
+    # resolved targets are shared, not copied per reference
+    assert response_schema["items"] is de_referenced_schema["components"]["schemas"]["Odd"]
+    assert de_referenced_schema["components"]["schemas"]["Odd"] == pet
+    # the original schema is left untouched
+    assert schema["components"]["schemas"]["Pets"]["items"] == {"$ref": "#/components/schemas/Pet"}
+
+
+def test_de_reference_recursive_schema():
+    schema = {"components": {"schemas": {"Node": node}}}
+    resolved_node = de_reference(schema, recursion_limit=2)["components"]["schemas"]["Node"]
+    for _ in range(4):
+        resolved_node = resolved_node["properties"]["child"]
+    assert resolved_node == {"x-recursive-ref-replaced": True}
+
+
+def test_de_reference_unresolvable_ref():
+    with pytest.raises(OpenAPISchemaError, match="Unable to resolve the schema reference `#/components/schemas/Pet`"):
+        de_reference({"schema": {"$ref": "#/components/schemas/Pet"}})
+    with pytest.raises(OpenAPISchemaError, match="Unable to resolve the schema reference `#Pet`"):
+        de_reference({"schema": {"$ref": "#Pet"}, "Pet": pet})
+
+
+def test_scan_refs():
+    assert scan_refs({"items": [{"type": "string"}]}) == (False, False)
+    assert scan_refs({"items": [{"$ref": "#/components/schemas/Pet"}]}) == (True, False)
+    assert scan_refs({"items": [{"$ref": "#/components/schemas/Pet"}, {"$ref": "pet.yaml"}]}) == (True, True)
+
+
+def get_schema_with_components(references: dict[str, list[str]]) -> dict:
+    return {
+        "components": {
+            "schemas": {
+                name: {
+                    "type": "object",
+                    "properties": {target.lower(): {"$ref": f"#/components/schemas/{target}"} for target in targets},
+                }
+                for name, targets in references.items()
+            }
+        }
+    }
+
+
+def test_de_reference_mutually_recursive_schema():
+    schema = get_schema_with_components({"A": ["A", "B", "C"], "B": ["A", "B", "C"], "C": ["A", "B", "C"]})
+    schema["paths"] = {"/a": {"$ref": "#/components/schemas/A"}, "/b": {"$ref": "#/components/schemas/A"}}
+    de_referenced_schema = de_reference(schema, recursion_limit=10)
+    assert de_referenced_schema["paths"]["/a"] is de_referenced_schema["paths"]["/b"]
+
+    resolved_node = de_referenced_schema["components"]["schemas"]["A"]
+    for target in "bcabcabcabc":
+        resolved_node = resolved_node["properties"][target]
+        assert resolved_node["type"] == "object"
+    assert resolved_node["properties"]["a"] == {"x-recursive-ref-replaced": True}
+
+
+def test_de_reference_long_cycle():
+    names = [f"Schema{i}" for i in range(500)]
+    schema = get_schema_with_components({name: [names[(i + 1) % len(names)]] for i, name in enumerate(names)})
+    resolved_node = de_reference(schema, recursion_limit=2)["components"]["schemas"]["Schema0"]
+    for name in names[1:4]:
+        resolved_node = resolved_node["properties"][name.lower()]
+    assert resolved_node["properties"]["schema4"] == {"x-recursive-ref-replaced": True}
+
+
+def test_de_reference_long_chain():
+    names = [f"Schema{i}" for i in range(500)]
+    schema = get_schema_with_components({name: names[i + 1 : i + 2] for i, name in enumerate(names)})
+    resolved_node = de_reference(schema)["components"]["schemas"]["Schema0"]
+    for name in names[1:]:
+        resolved_node = resolved_node["properties"][name.lower()]
+    assert resolved_node == {"type": "object", "properties": {}}